@@ -47,3 +47,9 @@ if sys.version_info[:2] < (3, 8):
         from cached_property import cached_property as cached_property
 else:
     from functools import cached_property as cached_property
+
+
+if sys.version_info[:2] < (3, 11):
+    import tomli as tomllib
+else:
+    import tomllib as tomllib
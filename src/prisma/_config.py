@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import errno
 import tempfile
 from pathlib import Path
-from typing import TYPE_CHECKING, Union
 from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Union
 
-import tomlkit
 from pydantic import BaseSettings, Extra, Field
 
+from ._compat import tomllib
+
 if TYPE_CHECKING:
     from pydantic.env_settings import SettingsSourceCallable
 
 
+_MISSING_FILE_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.ELOOP})
+
+
 class DefaultConfig(BaseSettings):
     # CLI version
     # TODO: if this version changes but the engine version
@@ -61,8 +66,9 @@ class Config(DefaultConfig):
 
     @classmethod
     def from_base(cls, config: DefaultConfig) -> Config:
-        if config.binary_cache_dir is None:
-            config.binary_cache_dir = (
+        values = config.dict()
+        if values['binary_cache_dir'] is None:
+            values['binary_cache_dir'] = (
                 Path(tempfile.gettempdir())
                 / 'prisma'
                 / 'binaries'
@@ -70,36 +76,75 @@ class Config(DefaultConfig):
                 / config.engine_version
             )
 
-        return cls.parse_obj(config.dict())
+        # the given config has already been validated and parse_obj() would
+        # result in the environment being read and validated all over again
+        return cls.construct(**values)
 
     @classmethod
     def load(cls, path: Path | None = None) -> Config:
         if path is None:
             path = Path('pyproject.toml')
 
-        if path.exists():
-            config = (
-                tomlkit.loads(path.read_text())
-                .get('tool', {})
-                .get('prisma', {})
-            )
-        else:
+        try:
+            stat = path.stat()
+        except OSError as exc:
+            # these are the same errors that Path.exists() treats as missing
+            if exc.errno not in _MISSING_FILE_ERRNOS:
+                raise
+
             config = {}
+        else:
+            config = _load_toml(
+                str(path.absolute()), stat.st_mtime_ns, stat.st_size
+            )
 
         return cls.from_base(DefaultConfig.parse_obj(config))
 
 
+# the parsed file is cached by its modification time and size so that loading the
+# config multiple times only results in a single stat call
+# NOTE: the returned dictionary is shared and must not be mutated
+@lru_cache(maxsize=8)
+def _load_toml(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    with open(path, 'rb') as file:
+        config: Dict[str, Any] = (
+            tomllib.load(file).get('tool', {}).get('prisma', {})
+        )
+
+    return config
+
+
 # TODO: ensure things like __name__, __dir__ are proxied correctly
 class LazyConfigProxy:
+    __slots__ = ('_config',)
+
+    def __init__(self) -> None:
+        self._config: Config | None = None
+
     def __getattr__(self, attr: str) -> object:
         return getattr(self.__get_proxied(), attr)
 
-    @lru_cache(maxsize=None)
     def __get_proxied(self) -> Config:
-        return Config.load()
+        config = self._config
+        if config is None:
+            config = self._config = Config.load()
+
+            # the config can never change once it has been loaded so we
+            # switch to a proxy that can access it without any checks
+            self.__class__ = _LoadedConfigProxy
+
+        return config
 
     def __repr__(self) -> str:
         return repr(self.__get_proxied())
 
     def __str__(self) -> str:
         return str(self.__get_proxied())
+
+
+class _LoadedConfigProxy(LazyConfigProxy):
+    __slots__ = ()
+    _config: Config
+
+    def __getattr__(self, attr: str) -> object:
+        return getattr(self._config, attr)
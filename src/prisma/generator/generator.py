@@ -7,7 +7,13 @@ from abc import ABC, abstractmethod
 from contextvars import ContextVar
 from typing import Generic, Dict, Type, Any, Optional, cast
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+)
+from jinja2.bccache import Bucket
 from pydantic import BaseModel
 
 from . import jsonrpc
@@ -20,7 +26,7 @@ from .utils import (
     resolve_template_path,
 )
 from .. import __version__
-from ..utils import DEBUG_GENERATOR
+from ..utils import DEBUG_GENERATOR, _env_bool
 from .._compat import cached_property
 from .._types import BaseModelT, InheritsGeneric, get_args
 
@@ -42,9 +48,70 @@ GENERIC_GENERATOR_NAME = 'prisma.generator.generator.GenericGenerator'
 # set of templates that should be rendered after every other template
 DEFERRED_TEMPLATES = {'partials.py.jinja'}
 
+
+class _FallbackBytecodeCache(BytecodeCache):
+    """Persists compiled templates between generator invocations so that
+    subsequent runs do not have to parse and compile every template again.
+
+    Bytecode is stored in a prisma specific sub-directory of the per-user jinja
+    cache directory, which is only created once a template is loaded. Caching can
+    be disabled by setting the `PRISMA_PY_DISABLE_TEMPLATE_CACHE` environment
+    variable and any errors raised while using the cache are ignored as the
+    templates can always be compiled from source instead.
+    """
+
+    def __init__(self) -> None:
+        self._cache: Optional[FileSystemBytecodeCache] = None
+        self._disabled = False
+
+    def _get_cache(self) -> Optional[FileSystemBytecodeCache]:
+        if self._cache is None and not self._disabled:
+            if _env_bool('PRISMA_PY_DISABLE_TEMPLATE_CACHE'):
+                self._disabled = True
+                return None
+
+            try:
+                root = Path(FileSystemBytecodeCache().directory)
+                directory = root / 'prisma'
+                directory.mkdir(mode=0o700, exist_ok=True)
+                self._cache = FileSystemBytecodeCache(str(directory))
+            except (OSError, RuntimeError) as exc:
+                log.debug('Not caching template bytecode: %s', exc)
+                self._disabled = True
+
+        return self._cache
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        cache = self._get_cache()
+        if cache is None:
+            return
+
+        # older versions of jinja do not write the cache files atomically so
+        # a truncated file can cause unpickling errors, not just I/O errors
+        try:
+            cache.load_bytecode(bucket)
+        except Exception as exc:
+            log.debug('Could not load cached template bytecode: %s', exc)
+            bucket.reset()
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        cache = self._get_cache()
+        if cache is None:
+            return
+
+        try:
+            cache.dump_bytecode(bucket)
+        except OSError as exc:
+            log.debug('Could not cache template bytecode: %s', exc)
+
+
+# the bundled templates cannot change while the generator is running so there is
+# no need for jinja to check whether or not the compiled templates are stale
 DEFAULT_ENV = Environment(
     trim_blocks=True,
     lstrip_blocks=True,
+    auto_reload=False,
+    bytecode_cache=_FallbackBytecodeCache(),
     loader=FileSystemLoader(Path(__file__).parent / 'templates'),
 )
 partial_models_ctx: ContextVar[Dict[str, PartialModelFields]] = ContextVar(
@@ -253,13 +320,16 @@ def render_template(
         env = DEFAULT_ENV
 
     template = env.get_template(name)
-    output = template.render(**params)
 
     file = resolve_template_path(rootdir=rootdir, name=name)
     if not file.parent.exists():
         file.parent.mkdir(parents=True, exist_ok=True)
 
-    file.write_bytes(output.encode(sys.getdefaultencoding()))
+    # the rendered output is streamed to the file so that we don't have to hold
+    # the entirety of large modules such as client.py in memory at once
+    template.stream(**params).dump(
+        str(file), encoding=sys.getdefaultencoding()
+    )
     log.debug('Rendered template to %s', file.absolute())
 
 
@@ -23,6 +23,11 @@ if TYPE_CHECKING:
 
 
 pytest_plugins = ['pytester']
+
+# tests generate the client from temporary copies of the package which would
+# otherwise leave orphaned template bytecode in the cache directory
+os.environ.setdefault('PRISMA_PY_DISABLE_TEMPLATE_CACHE', '1')
+
 LOGGING_CONTEXT_MANAGER = setup_logging(use_handler=False)
 
 
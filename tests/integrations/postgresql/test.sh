@@ -11,7 +11,21 @@ set -x
 pip install -U -r requirements.txt
 pip install -U --force-reinstall ../../../.tests_cache/dist/*.whl
 
-prisma db push --accept-data-loss --force-reset
+# the database is only reset when the schema or the database URL has changed
+# since the last run, otherwise the schema is pushed without dropping the
+# database which is quick when it is already in sync and still creates any
+# missing tables, e.g. if a local database container was re-created
+# NOTE: tracing is disabled so that the database URL is not logged
+set +x
+SCHEMA_HASH=$( (cat schema.prisma; echo "${PRISMA_PY_POSTGRES_URL:-}") | sha256sum | cut -d ' ' -f 1)
+set -x
+
+if [ "$(cat .venv/schema.hash 2>/dev/null)" == "$SCHEMA_HASH" ]; then
+    prisma db push --accept-data-loss
+else
+    prisma db push --accept-data-loss --force-reset
+    echo "$SCHEMA_HASH" > .venv/schema.hash
+fi
 
 coverage run -m pytest --confcutdir=. tests
 
@@ -37,6 +37,7 @@ def pytest_runtest_setup(item: pytest.Function) -> None:
 
 
 async def cleanup_client(client: Prisma) -> None:
-    for _, item in inspect.getmembers(client):
-        if item.__class__.__name__.endswith('Actions'):
-            await item.delete_many()
+    async with client.batch_() as batcher:
+        for _, item in inspect.getmembers(batcher):
+            if item.__class__.__name__.endswith('Actions'):
+                item.delete_many()
@@ -83,18 +83,20 @@ async def test_update_many(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_updating_strings(client: Prisma) -> None:
     """Updating a String[] value"""
-    models = [
-        await client.lists.create({}),
-        await client.lists.create(
-            data={
+    total = await client.lists.create_many(
+        [
+            {'id': 'a'},
+            {
+                'id': 'b',
                 'strings': ['a', 'b', 'c'],
             },
-        ),
-    ]
+        ],
+    )
+    assert total == 2
 
     model = await client.lists.update(
         where={
-            'id': models[0].id,
+            'id': 'a',
         },
         data={
             'strings': {
@@ -107,7 +109,7 @@ async def test_updating_strings(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'strings': {
@@ -120,7 +122,7 @@ async def test_updating_strings(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'strings': {
@@ -133,7 +135,7 @@ async def test_updating_strings(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'strings': ['f'],
@@ -146,18 +148,20 @@ async def test_updating_strings(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_updating_bytes(client: Prisma) -> None:
     """Updating a Bytes[] value"""
-    models = [
-        await client.lists.create({}),
-        await client.lists.create(
-            data={
+    total = await client.lists.create_many(
+        [
+            {'id': 'a'},
+            {
+                'id': 'b',
                 'bytes': [Base64.encode(b'foo'), Base64.encode(b'bar')],
             },
-        ),
-    ]
+        ],
+    )
+    assert total == 2
 
     model = await client.lists.update(
         where={
-            'id': models[0].id,
+            'id': 'a',
         },
         data={
             'bytes': {
@@ -170,7 +174,7 @@ async def test_updating_bytes(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'bytes': {
@@ -187,7 +191,7 @@ async def test_updating_bytes(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'bytes': {
@@ -200,7 +204,7 @@ async def test_updating_bytes(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'bytes': [Base64.encode(b'e')],
@@ -214,18 +218,20 @@ async def test_updating_bytes(client: Prisma) -> None:
 async def test_updating_datetime(client: Prisma) -> None:
     """Updating a DateTime[] value"""
     now = _utcnow()
-    models = [
-        await client.lists.create({}),
-        await client.lists.create(
-            data={
+    total = await client.lists.create_many(
+        [
+            {'id': 'a'},
+            {
+                'id': 'b',
                 'dates': [now, now + timedelta(hours=3)],
             },
-        ),
-    ]
+        ],
+    )
+    assert total == 2
 
     model = await client.lists.update(
         where={
-            'id': models[0].id,
+            'id': 'a',
         },
         data={
             'dates': {
@@ -238,7 +244,7 @@ async def test_updating_datetime(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'dates': {
@@ -253,7 +259,7 @@ async def test_updating_datetime(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'dates': {
@@ -266,7 +272,7 @@ async def test_updating_datetime(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'dates': [now + timedelta(hours=999)],
@@ -279,18 +285,20 @@ async def test_updating_datetime(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_updating_boolean(client: Prisma) -> None:
     """Updating a Boolean[] value"""
-    models = [
-        await client.lists.create({}),
-        await client.lists.create(
-            data={
+    total = await client.lists.create_many(
+        [
+            {'id': 'a'},
+            {
+                'id': 'b',
                 'bools': [False, True],
             },
-        ),
-    ]
+        ],
+    )
+    assert total == 2
 
     model = await client.lists.update(
         where={
-            'id': models[0].id,
+            'id': 'a',
         },
         data={
             'bools': {
@@ -303,7 +311,7 @@ async def test_updating_boolean(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'bools': {
@@ -316,7 +324,7 @@ async def test_updating_boolean(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'bools': {
@@ -329,7 +337,7 @@ async def test_updating_boolean(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'bools': [True],
@@ -342,18 +350,20 @@ async def test_updating_boolean(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_updating_ints(client: Prisma) -> None:
     """Updating a Int[] value"""
-    models = [
-        await client.lists.create({}),
-        await client.lists.create(
-            data={
+    total = await client.lists.create_many(
+        [
+            {'id': 'a'},
+            {
+                'id': 'b',
                 'ints': [1, 2, 3],
             },
-        ),
-    ]
+        ],
+    )
+    assert total == 2
 
     model = await client.lists.update(
         where={
-            'id': models[0].id,
+            'id': 'a',
         },
         data={
             'ints': {
@@ -366,7 +376,7 @@ async def test_updating_ints(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'ints': {
@@ -379,7 +389,7 @@ async def test_updating_ints(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'ints': {
@@ -392,7 +402,7 @@ async def test_updating_ints(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'ints': [6],
@@ -405,18 +415,20 @@ async def test_updating_ints(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_updating_bigints(client: Prisma) -> None:
     """Updating a BigInt[] value"""
-    models = [
-        await client.lists.create({}),
-        await client.lists.create(
-            data={
+    total = await client.lists.create_many(
+        [
+            {'id': 'a'},
+            {
+                'id': 'b',
                 'bigints': [539506179039297536, 281454500584095754],
             },
-        ),
-    ]
+        ],
+    )
+    assert total == 2
 
     model = await client.lists.update(
         where={
-            'id': models[0].id,
+            'id': 'a',
         },
         data={
             'bigints': {
@@ -429,7 +441,7 @@ async def test_updating_bigints(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'bigints': {
@@ -446,7 +458,7 @@ async def test_updating_bigints(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'bigints': {
@@ -459,7 +471,7 @@ async def test_updating_bigints(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'bigints': [298490675715112960],
@@ -472,18 +484,20 @@ async def test_updating_bigints(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_updating_floats(client: Prisma) -> None:
     """Updating a Float[] value"""
-    models = [
-        await client.lists.create({}),
-        await client.lists.create(
-            data={
+    total = await client.lists.create_many(
+        [
+            {'id': 'a'},
+            {
+                'id': 'b',
                 'floats': [3.4, 6.8, 12.4],
             },
-        ),
-    ]
+        ],
+    )
+    assert total == 2
 
     model = await client.lists.update(
         where={
-            'id': models[0].id,
+            'id': 'a',
         },
         data={
             'floats': {
@@ -496,7 +510,7 @@ async def test_updating_floats(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'floats': {
@@ -509,7 +523,7 @@ async def test_updating_floats(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'floats': {
@@ -522,7 +536,7 @@ async def test_updating_floats(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'floats': [80],
@@ -535,18 +549,20 @@ async def test_updating_floats(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_updating_json(client: Prisma) -> None:
     """Updating a Json[] value"""
-    models = [
-        await client.lists.create({}),
-        await client.lists.create(
-            data={
+    total = await client.lists.create_many(
+        [
+            {'id': 'a'},
+            {
+                'id': 'b',
                 'json_objects': [Json('foo'), Json(['foo', 'bar'])],
             },
-        ),
-    ]
+        ],
+    )
+    assert total == 2
 
     model = await client.lists.update(
         where={
-            'id': models[0].id,
+            'id': 'a',
         },
         data={
             'json_objects': {
@@ -559,7 +575,7 @@ async def test_updating_json(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'json_objects': {
@@ -572,7 +588,7 @@ async def test_updating_json(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'json_objects': {
@@ -585,7 +601,7 @@ async def test_updating_json(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'json_objects': [Json.keys(world=None)],
@@ -598,18 +614,20 @@ async def test_updating_json(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_updating_enum(client: Prisma) -> None:
     """Updating a Role[] enum value"""
-    models = [
-        await client.lists.create({}),
-        await client.lists.create(
-            data={
+    total = await client.lists.create_many(
+        [
+            {'id': 'a'},
+            {
+                'id': 'b',
                 'roles': [Role.USER, Role.ADMIN],
             },
-        ),
-    ]
+        ],
+    )
+    assert total == 2
 
     model = await client.lists.update(
         where={
-            'id': models[0].id,
+            'id': 'a',
         },
         data={
             'roles': {
@@ -622,7 +640,7 @@ async def test_updating_enum(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'roles': {
@@ -635,7 +653,7 @@ async def test_updating_enum(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'roles': {
@@ -648,7 +666,7 @@ async def test_updating_enum(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'roles': [Role.ADMIN],
@@ -661,18 +679,20 @@ async def test_updating_enum(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_updating_decimal(client: Prisma) -> None:
     """Updating a Decimal[] value"""
-    models = [
-        await client.lists.create({}),
-        await client.lists.create(
-            data={
+    total = await client.lists.create_many(
+        [
+            {'id': 'a'},
+            {
+                'id': 'b',
                 'decimals': [Decimal('22.99'), Decimal('30.01')],
             },
-        ),
-    ]
+        ],
+    )
+    assert total == 2
 
     model = await client.lists.update(
         where={
-            'id': models[0].id,
+            'id': 'a',
         },
         data={
             'decimals': {
@@ -685,7 +705,7 @@ async def test_updating_decimal(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'decimals': {
@@ -698,7 +718,7 @@ async def test_updating_decimal(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'decimals': {
@@ -711,7 +731,7 @@ async def test_updating_decimal(client: Prisma) -> None:
 
     model = await client.lists.update(
         where={
-            'id': models[1].id,
+            'id': 'b',
         },
         data={
             'decimals': [Decimal('7')],
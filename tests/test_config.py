@@ -31,6 +31,26 @@ def test_no_file(testdir: Testdir) -> None:
     assert isinstance(config.prisma_version, str)
 
 
+def test_path_through_file(testdir: Testdir) -> None:
+    """Config loading works when a parent of the given path is a file"""
+    testdir.makefile('.toml', pyproject='')
+    path = Path('pyproject.toml/foo')
+    assert not path.exists()
+
+    config = Config.load(path)
+    assert isinstance(config.prisma_version, str)
+
+
+def test_symlink_loop(testdir: Testdir) -> None:
+    """Config loading works when pyproject.toml is a symlink loop"""
+    path = Path('pyproject.toml')
+    path.symlink_to(path)
+    assert not path.exists()
+
+    config = Config.load(path)
+    assert isinstance(config.prisma_version, str)
+
+
 def test_loading(testdir: Testdir) -> None:
     """Config loading overrides defaults"""
     testdir.makefile(
@@ -84,3 +104,30 @@ def test_env_var_takes_priority(testdir: Testdir) -> None:
     with temp_env_update({'PRISMA_VERSION': '1.5'}):
         config = Config.load()
         assert config.prisma_version == '1.5'
+
+
+def test_reloads_modified_file(testdir: Testdir) -> None:
+    """Changes to the pyproject.toml file are picked up by subsequent loads"""
+    testdir.makefile(
+        '.toml',
+        pyproject=dedent(
+            """
+            [tool.prisma]
+            prisma_version = '0.3'
+            """
+        ),
+    )
+    config = Config.load()
+    assert config.prisma_version == '0.3'
+
+    testdir.makefile(
+        '.toml',
+        pyproject=dedent(
+            """
+            [tool.prisma]
+            prisma_version = '0.4.0'
+            """
+        ),
+    )
+    config = Config.load()
+    assert config.prisma_version == '0.4.0'
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from prisma import errors, Prisma
@@ -7,12 +9,19 @@ from .utils import assert_time_like_now
 @pytest.mark.asyncio
 async def test_create(client: Prisma) -> None:
     """Basic record creation"""
-    post = await client.post.create(
-        {
-            'title': 'Hi from Prisma!',
-            'published': True,
-            'desc': 'Prisma is a database toolkit that makes databases easy.',
-        }
+    post, user = await asyncio.gather(
+        client.post.create(
+            {
+                'title': 'Hi from Prisma!',
+                'published': True,
+                'desc': 'Prisma is a database toolkit that makes databases easy.',
+            }
+        ),
+        client.user.create(
+            {
+                'name': 'Robert',
+            }
+        ),
     )
     assert isinstance(post.id, str)
     assert post.title == 'Hi from Prisma!'
@@ -23,11 +32,6 @@ async def test_create(client: Prisma) -> None:
     assert_time_like_now(post.created_at)
     assert_time_like_now(post.updated_at)
 
-    user = await client.user.create(
-        {
-            'name': 'Robert',
-        }
-    )
     assert user.name == 'Robert'
     assert isinstance(user.id, str)
 
@@ -4,6 +4,8 @@ from pathlib import Path
 
 import pytest
 from jinja2 import Environment, FileSystemLoader
+from pytest_mock import MockerFixture
+from _pytest.monkeypatch import MonkeyPatch
 from prisma import __version__
 from prisma.generator import (
     BASE_PACKAGE_DIR,
@@ -14,6 +16,7 @@ from prisma.generator import (
     cleanup_templates,
 )
 from prisma.generator.utils import Faker, copy_tree
+from prisma.generator.generator import _FallbackBytecodeCache
 
 from .utils import assert_module_is_clean, assert_module_not_clean
 from ..utils import Testdir
@@ -32,6 +35,75 @@ def test_repeated_rstrip_bug(tmp_path: Path) -> None:
     assert tmp_path.joinpath('schema.prisma').read_text() == 'foo'
 
 
+def test_bytecode_cache_unavailable(
+    tmp_path: Path, mocker: MockerFixture, monkeypatch: MonkeyPatch
+) -> None:
+    """Templates are still rendered if the bytecode cache cannot be created"""
+    monkeypatch.delenv('PRISMA_PY_DISABLE_TEMPLATE_CACHE', raising=False)
+    mocker.patch(
+        'prisma.generator.generator.FileSystemBytecodeCache',
+        side_effect=RuntimeError('Cannot determine safe temp directory.'),
+    )
+    assert _render_with_bytecode_cache(tmp_path) == '2'
+
+
+def test_bytecode_cache_errors(
+    tmp_path: Path, mocker: MockerFixture, monkeypatch: MonkeyPatch
+) -> None:
+    """Errors reading from or writing to the bytecode cache are ignored"""
+    monkeypatch.delenv('PRISMA_PY_DISABLE_TEMPLATE_CACHE', raising=False)
+    cache = mocker.patch(
+        'prisma.generator.generator.FileSystemBytecodeCache'
+    ).return_value
+    cache.directory = str(tmp_path)
+    cache.load_bytecode.side_effect = PermissionError('Permission denied')
+    cache.dump_bytecode.side_effect = OSError('No space left on device')
+
+    assert _render_with_bytecode_cache(tmp_path) == '2'
+    cache.load_bytecode.assert_called_once()
+    cache.dump_bytecode.assert_called_once()
+
+
+def test_bytecode_cache_corrupted(
+    tmp_path: Path, mocker: MockerFixture, monkeypatch: MonkeyPatch
+) -> None:
+    """Corrupted bytecode cache files are ignored"""
+    monkeypatch.delenv('PRISMA_PY_DISABLE_TEMPLATE_CACHE', raising=False)
+    cache = mocker.patch(
+        'prisma.generator.generator.FileSystemBytecodeCache'
+    ).return_value
+    cache.directory = str(tmp_path)
+    cache.load_bytecode.side_effect = EOFError('Ran out of input')
+
+    assert _render_with_bytecode_cache(tmp_path) == '2'
+    cache.load_bytecode.assert_called_once()
+    cache.dump_bytecode.assert_called_once()
+
+
+def test_bytecode_cache_disabled(
+    tmp_path: Path, mocker: MockerFixture, monkeypatch: MonkeyPatch
+) -> None:
+    """The bytecode cache is not used if it has been disabled"""
+    monkeypatch.setenv('PRISMA_PY_DISABLE_TEMPLATE_CACHE', '1')
+    mocked = mocker.patch('prisma.generator.generator.FileSystemBytecodeCache')
+
+    assert _render_with_bytecode_cache(tmp_path) == '2'
+    mocked.assert_not_called()
+
+
+def _render_with_bytecode_cache(tmp_path: Path) -> str:
+    templates = tmp_path / 'templates'
+    templates.mkdir()
+    templates.joinpath('foo.py.jinja').write_text('{{ 1 + 1 }}')
+
+    env = Environment(
+        loader=FileSystemLoader(str(templates)),
+        bytecode_cache=_FallbackBytecodeCache(),
+    )
+    render_template(tmp_path, 'foo.py.jinja', dict(), env=env)
+    return tmp_path.joinpath('foo.py').read_text()
+
+
 def test_template_cleanup(testdir: Testdir) -> None:
     """Cleaning up templates removes all rendered files"""
     path = testdir.path / 'prisma'
@@ -210,24 +210,25 @@ async def test_atomic_update_invalid_input(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_filtering_nulls(client: Prisma) -> None:
     """None is a valid filter for nullable BigInt fields"""
-    await client.types.create(
-        {
-            'string': 'a',
-            'optional_bigint': None,
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'b',
-            'optional_bigint': 12437823782382,
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'c',
-            'optional_bigint': 8239829842494,
-        },
-    )
+    async with client.batch_() as batcher:
+        batcher.types.create(
+            {
+                'string': 'a',
+                'optional_bigint': None,
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'b',
+                'optional_bigint': 12437823782382,
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'c',
+                'optional_bigint': 8239829842494,
+            },
+        )
 
     found = await client.types.find_first(
         where={
@@ -54,24 +54,25 @@ async def test_filtering(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_filtering_nulls(client: Prisma) -> None:
     """None is a valid filter for nullable Boolean fields"""
-    await client.types.create(
-        {
-            'string': 'a',
-            'optional_bool': None,
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'b',
-            'optional_bool': True,
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'c',
-            'optional_bool': False,
-        },
-    )
+    async with client.batch_() as batcher:
+        batcher.types.create(
+            {
+                'string': 'a',
+                'optional_bool': None,
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'b',
+                'optional_bool': True,
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'c',
+                'optional_bool': False,
+            },
+        )
 
     found = await client.types.find_first(
         where={
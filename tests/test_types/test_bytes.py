@@ -109,24 +109,25 @@ async def test_constructing(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_filtering_nulls(client: Prisma) -> None:
     """None is a valid filter for nullable Bytes fields"""
-    await client.types.create(
-        {
-            'string': 'a',
-            'optional_bytes': None,
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'b',
-            'optional_bytes': Base64.encode(b'foo'),
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'c',
-            'optional_bytes': Base64.encode(b'bar'),
-        },
-    )
+    async with client.batch_() as batcher:
+        batcher.types.create(
+            {
+                'string': 'a',
+                'optional_bytes': None,
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'b',
+                'optional_bytes': Base64.encode(b'foo'),
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'c',
+                'optional_bytes': Base64.encode(b'bar'),
+            },
+        )
 
     found = await client.types.find_first(
         where={
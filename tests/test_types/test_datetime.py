@@ -186,24 +186,25 @@ async def test_tz_aware(client: Prisma) -> None:
 async def test_filtering_nulls(client: Prisma) -> None:
     """None is a valid filter for nullable DateTime fields"""
     now = datetime.datetime.now(datetime.timezone.utc)
-    await client.types.create(
-        {
-            'string': 'a',
-            'optional_datetime': None,
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'b',
-            'optional_datetime': now,
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'c',
-            'optional_datetime': now + datetime.timedelta(days=1),
-        },
-    )
+    async with client.batch_() as batcher:
+        batcher.types.create(
+            {
+                'string': 'a',
+                'optional_datetime': None,
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'b',
+                'optional_datetime': now,
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'c',
+                'optional_datetime': now + datetime.timedelta(days=1),
+            },
+        )
 
     found = await client.types.find_first(
         where={
@@ -203,24 +203,25 @@ async def test_filtering(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_filtering_nulls(client: Prisma) -> None:
     """None is a valid filter for nullable Decimal fields"""
-    await client.types.create(
-        {
-            'string': 'a',
-            'optional_decimal': None,
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'b',
-            'optional_decimal': Decimal('3'),
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'c',
-            'optional_decimal': Decimal('4'),
-        },
-    )
+    async with client.batch_() as batcher:
+        batcher.types.create(
+            {
+                'string': 'a',
+                'optional_decimal': None,
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'b',
+                'optional_decimal': Decimal('3'),
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'c',
+                'optional_decimal': Decimal('4'),
+            },
+        )
 
     found = await client.types.find_first(
         where={
@@ -210,24 +210,25 @@ async def test_atomic_update_invalid_input(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_filtering_nulls(client: Prisma) -> None:
     """None is a valid filter for nullable Float fields"""
-    await client.types.create(
-        {
-            'string': 'a',
-            'optional_float': None,
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'b',
-            'optional_float': 1.2,
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'c',
-            'optional_float': 5,
-        },
-    )
+    async with client.batch_() as batcher:
+        batcher.types.create(
+            {
+                'string': 'a',
+                'optional_float': None,
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'b',
+                'optional_float': 1.2,
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'c',
+                'optional_float': 5,
+            },
+        )
 
     found = await client.types.find_first(
         where={
@@ -210,24 +210,25 @@ async def test_atomic_update_invalid_input(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_filtering_nulls(client: Prisma) -> None:
     """None is a valid filter for nullable Int fields"""
-    await client.types.create(
-        {
-            'string': 'a',
-            'optional_int': None,
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'b',
-            'optional_int': 1,
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'c',
-            'optional_int': 2,
-        },
-    )
+    async with client.batch_() as batcher:
+        batcher.types.create(
+            {
+                'string': 'a',
+                'optional_int': None,
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'b',
+                'optional_int': 1,
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'c',
+                'optional_int': 2,
+            },
+        )
 
     found = await client.types.find_first(
         where={
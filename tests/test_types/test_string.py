@@ -119,24 +119,25 @@ async def test_filtering(client: Prisma) -> None:
 @pytest.mark.asyncio
 async def test_filtering_nulls(client: Prisma) -> None:
     """None is a valid filter for nullable String fields"""
-    await client.types.create(
-        {
-            'string': 'a',
-            'optional_string': None,
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'b',
-            'optional_string': 'null',
-        },
-    )
-    await client.types.create(
-        {
-            'string': 'c',
-            'optional_string': 'robert@craigie.dev',
-        },
-    )
+    async with client.batch_() as batcher:
+        batcher.types.create(
+            {
+                'string': 'a',
+                'optional_string': None,
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'b',
+                'optional_string': 'null',
+            },
+        )
+        batcher.types.create(
+            {
+                'string': 'c',
+                'optional_string': 'robert@craigie.dev',
+            },
+        )
 
     found = await client.types.find_first(
         where={